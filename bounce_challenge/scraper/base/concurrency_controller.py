@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterator, Optional, Set
+
+# the default upper bound of in-flight requests, also sizing the connection pools
+DEFAULT_MAX_LIMIT: int = 16
+
+class AdaptiveConcurrencyController():
+    """Limits the amount of in-flight requests using an AIMD
+        (additive increase, multiplicative decrease) policy.
+
+        The limit grows by additive_increase once a full window (limit) of healthy
+        responses has been observed, and is multiplied by decrease_factor whenever
+        a throttling status (403, 429, 5xx), a transport error or a latency spike is observed.
+    """
+
+    _THROTTLING_STATUS_CODES: Set[int] = {403, 429}
+
+    def __init__(self: AdaptiveConcurrencyController, initial_limit: int = 2, min_limit: int = 1,
+                 max_limit: int = DEFAULT_MAX_LIMIT, additive_increase: int = 1, decrease_factor: float = 0.5,
+                 latency_tolerance: float = 2.0, latency_smoothing: float = 0.2, min_latency_spike: float = 0.1) -> None:
+        """Instantiates an AdaptiveConcurrencyController
+
+        Parameters
+        ----------
+        initial_limit : int, optional
+            The starting amount of allowed in-flight requests, by default 2
+        min_limit : int, optional
+            The lower bound of the limit, by default 1
+        max_limit : int, optional
+            The upper bound of the limit, by default 16
+        additive_increase : int, optional
+            The amount added to the limit after a healthy window, by default 1
+        decrease_factor : float, optional
+            The factor applied to the limit on backoff, by default 0.5
+        latency_tolerance : float, optional
+            The multiple of the baseline latency considered a spike, by default 2.0
+        latency_smoothing : float, optional
+            The weight of the latest sample in the baseline latency moving average, by default 0.2
+        min_latency_spike : float, optional
+            The latency in seconds below which no response is considered a spike,
+            avoiding backoffs on jitter of very fast responses (e.g. replayed), by default 0.1
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                f"Invalid concurrency limits: {min_limit} <= {initial_limit} <= {max_limit}")
+
+        self._limit = initial_limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._additive_increase = additive_increase
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._latency_smoothing = latency_smoothing
+        self._min_latency_spike = min_latency_spike
+
+        self._in_flight: int = 0
+        self._healthy_responses: int = 0
+        self._baseline_latency: Optional[float] = None
+        # requests started before the last backoff must not trigger another one
+        self._backoff_epoch: int = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self: AdaptiveConcurrencyController) -> Iterator[int]:
+        """Blocks until a request slot is available and holds it for the duration of the context
+
+        Returns
+        -------
+        Iterator[int]
+            The backoff epoch in which the request started, to be passed onto record
+        """
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+
+            self._in_flight += 1
+            backoff_epoch: int = self._backoff_epoch
+
+        try:
+            yield backoff_epoch
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def record(self: AdaptiveConcurrencyController, status_code: int, latency: float, backoff_epoch: int) -> None:
+        """Feeds a response outcome into the controller, adjusting the limit
+
+        Parameters
+        ----------
+        status_code : int
+            The response status code
+        latency : float
+            The response latency in seconds
+        backoff_epoch : int
+            The backoff epoch returned by slot when the request started
+        """
+        with self._condition:
+            is_throttled: bool = status_code in self._THROTTLING_STATUS_CODES or status_code >= 500
+            is_latency_spike: bool = self._baseline_latency is not None and latency > self._min_latency_spike and \
+                latency > self._baseline_latency * self._latency_tolerance
+
+            if not is_throttled:
+                # spikes feed the baseline as well, so a lasting latency shift is eventually absorbed
+                self._baseline_latency = latency if self._baseline_latency is None else \
+                    (1 - self._latency_smoothing) * self._baseline_latency + self._latency_smoothing * latency
+
+            if is_throttled or is_latency_spike:
+                if backoff_epoch == self._backoff_epoch:
+                    self._backoff(reason=f"status {status_code}" if is_throttled else f"latency {latency:.2f}s")
+
+                return
+
+            self._healthy_responses += 1
+
+            if self._healthy_responses >= self._limit and self._limit < self._max_limit:
+                self._healthy_responses = 0
+                self._limit = min(self._max_limit, self._limit + self._additive_increase)
+                self._condition.notify_all()
+
+                logging.info(f"Increased concurrency limit to {self._limit}")
+
+    def record_error(self: AdaptiveConcurrencyController, error: BaseException, backoff_epoch: int) -> None:
+        """Feeds a transport failure (e.g. a connection error or timeout) into the controller,
+            decreasing the limit as for throttling responses
+
+        Parameters
+        ----------
+        error : BaseException
+            The error raised by the request
+        backoff_epoch : int
+            The backoff epoch returned by slot when the request started
+        """
+        with self._condition:
+            if backoff_epoch == self._backoff_epoch:
+                self._backoff(reason=f"error {error!r}")
+
+    def _backoff(self: AdaptiveConcurrencyController, reason: str) -> None:
+        self._backoff_epoch += 1
+        self._healthy_responses = 0
+        self._limit = max(self._min_limit, int(self._limit * self._decrease_factor))
+
+        logging.warning(f"Decreased concurrency limit to {self._limit} due to {reason}")
+
+    @property
+    def limit(self: AdaptiveConcurrencyController) -> int:
+        """Returns the current amount of allowed in-flight requests
+
+        Returns
+        -------
+        int
+            The current concurrency limit
+        """
+        return self._limit
+
+    @property
+    def max_limit(self: AdaptiveConcurrencyController) -> int:
+        """Returns the upper bound of allowed in-flight requests
+
+        Returns
+        -------
+        int
+            The maximum concurrency limit
+        """
+        return self._max_limit
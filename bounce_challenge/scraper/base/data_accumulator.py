@@ -3,11 +3,13 @@ from __future__ import annotations
 import csv
 import json
 import logging
+import os
+import uuid
 from enum import Enum, unique
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, List, Optional
+    from typing import Any, Dict, List, Optional, TextIO, Type
 
 
 @unique
@@ -16,29 +18,14 @@ class DataOutputType(Enum):
     JSON = "json"
 
 
-class DataAccumulator():
-    """Defines a utility to accumulate the extracted data
-        in addition to functions to assist in its manipulation.
+class StreamingDataWriter():
+    """Writes the extracted data onto the output path as it is provided,
+        keeping no data in memory. The data is written onto a temporary file next to the
+        output path, which only replaces the output path once closed successfully.
     """
 
-    def __init__(self: DataAccumulator) -> None:
-        self._data = None
-
-    def add_json_data(self: DataAccumulator, data: Dict[str, str]) -> None:
-        """Adds a set of JSON (dict) data into the accumulator
-
-        Parameters
-        ----------
-        data : Dict[str, str]
-            The data to be added in a JSON (Dict) format
-        """
-        if not self._data:
-            self._data = data
-        else:
-            self._data.update(data)
-
-    def dump(self: DataAccumulator, output_path: str, output_type: DataOutputType, data_filters: List[str] = None) -> None:
-        """Stores the accumulated information onto the defined output path
+    def __init__(self: StreamingDataWriter, output_path: str, output_type: DataOutputType) -> None:
+        """Instantiates a StreamingDataWriter
 
         Parameters
         ----------
@@ -46,90 +33,127 @@ class DataAccumulator():
             The local filesystem path in which to store the information
         output_type : DataOutputType
             The data output type
-        data_filters : List[str], optional
-            The set of data headers to retain, by default None
 
         Raises
         ------
         NotImplementedError
             Raises a not implemented error should the output_type not be implemented
         """
-        if len(self._data) > 0:
-            match(output_type):
-                case DataOutputType.CSV:
-                    self._to_csv(output_path=output_path,
-                                 data_filters=data_filters)
-                case DataOutputType.JSON:
-                    self._to_json(output_path=output_path,
-                                  data_filters=data_filters)
-                case _:
-                    raise NotImplementedError(
-                        f"Accumulator dump not implemented for output type {output_type}")
+        if output_type not in (DataOutputType.CSV, DataOutputType.JSON):
+            raise NotImplementedError(
+                f"Streaming writer not implemented for output type {output_type}")
 
-        else:
-            logging.warning(
-                "Skipping data saving due to no data being provided.")
+        self._output_path = output_path
+        self._output_type = output_type
+        self._output_file: Optional[TextIO] = None
+        self._temporary_path: Optional[str] = None
+        self._csv_writer: Optional[csv.DictWriter] = None
 
-    def _to_csv(self: DataAccumulator, output_path: str, data_filters: List[str] = None) -> None:
-        """Stores the data into a CSV format
+    def write(self: StreamingDataWriter, data: List[Dict[str, Any]]) -> None:
+        """Appends a set of JSON (dict) data onto the output
 
         Parameters
         ----------
-        output_path : str
-            The local filesystem path in which to store the information
-        data_filters : List[str], optional
-            The set of data headers to retain, by default None
+        data : List[Dict[str, Any]]
+            The data to be written in a JSON (Dict) format
         """
-        filtered_data: Dict[str, Any] = self._filter_data(
-            data_filters=data_filters)
-        csv_headers: List[str] = filtered_data[0].keys()
+        if not data:
+            return
+
+        match(self._output_type):
+            case DataOutputType.CSV:
+                if self._output_file is None:
+                    self._open_output()
+                    # the headers are defined by the first item
+                    self._csv_writer = csv.DictWriter(self._output_file, fieldnames=data[0].keys())
+                    self._csv_writer.writeheader()
+
+                self._csv_writer.writerows(data)
+            case DataOutputType.JSON:
+                for item in data:
+                    if self._output_file is None:
+                        self._open_output()
+                        self._output_file.write("[")
+                    else:
+                        self._output_file.write(",")
+
+                    # matches the layout of json.dump(data, indent=4) one item at a time
+                    item_json: str = json.dumps(item, indent=4, ensure_ascii=False)
+                    self._output_file.write("\n    " + item_json.replace("\n", "\n    "))
+
+    def close(self: StreamingDataWriter) -> None:
+        """Finalizes the output and moves it onto the output path
+        """
+        if self._output_file is None:
+            logging.warning(
+                "Skipping data saving due to no data being provided.")
+            return
 
-        with open(output_path, 'w', newline='', encoding='UTF-8') as output_csv:
-            writer = csv.DictWriter(output_csv, fieldnames=csv_headers)
-            writer.writeheader()
-            writer.writerows(filtered_data)
+        if self._output_type == DataOutputType.JSON:
+            self._output_file.write("\n]")
 
-    def _to_json(self: DataAccumulator, output_path: str, data_filters: List[str] = None) -> None:
-        """Stores the data into a JSON format
+        self._output_file.close()
+        os.replace(self._temporary_path, self._output_path)
 
-        Parameters
-        ----------
-        output_path : str
-            The local filesystem path in which to store the information
-        data_filters : List[str], optional
-            The set of data headers to retain, by default None
+        self._output_file = None
+        self._temporary_path = None
+
+    def discard(self: StreamingDataWriter) -> None:
+        """Removes the written data, leaving the output path untouched
         """
-        filtered_data: Dict[str, Any] = self._filter_data(
-            data_filters=data_filters)
+        if self._output_file is None:
+            return
 
-        with open(output_path, 'w', newline='', encoding='UTF-8') as outfile:
-            json.dump(filtered_data, outfile, indent=4, ensure_ascii=False)
+        self._output_file.close()
+        os.remove(self._temporary_path)
 
-    def _filter_data(self: DataAccumulator, data_filters: List[str] = None) -> List[Any]:
-        """Filters the existing data by selecting only data whose key
-            is present in data_filters
+        self._output_file = None
+        self._temporary_path = None
 
-        Parameters
-        ----------
-        data_filters : List[str], optional
-            The set of data headers to retain, by default None
+    def _open_output(self: StreamingDataWriter) -> None:
+        # the temporary file is placed next to the output path, so that replacing it is atomic
+        (output_directory, output_name) = os.path.split(os.path.abspath(self._output_path))
+        self._temporary_path = os.path.join(output_directory, f".{output_name}.{uuid.uuid4().hex}.tmp")
+        self._output_file = open(self._temporary_path, 'x', newline='', encoding='UTF-8')
 
-        Returns
-        -------
-        List[Any]
-            The filtered information
-        """
-        if not data_filters:
-            return self._data
+    def __enter__(self: StreamingDataWriter) -> StreamingDataWriter:
+        return self
+
+    def __exit__(self: StreamingDataWriter, exc_type: Optional[Type[BaseException]], *args) -> None:
+        # a failed run must not leave a truncated output that looks valid
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def project_data(data: List[Dict[str, Any]], data_filters: List[str] = None) -> List[Any]:
+    """Projects the data by selecting only data whose key
+        is present in data_filters
+
+    Parameters
+    ----------
+    data : List[Dict[str, Any]]
+        The data to be projected
+    data_filters : List[str], optional
+        The set of data headers to retain, by default None
+
+    Returns
+    -------
+    List[Any]
+        The projected information
+    """
+    if not data_filters:
+        return data
 
-        output_data: List[Optional[Dict[str, Any]]] = []
+    output_data: List[Optional[Dict[str, Any]]] = []
 
-        for list_item in self._data:
-            filtered_list_item: Dict[str, Any] = {}
-            for (k, v) in list_item.items():
-                if k in data_filters:
-                    filtered_list_item[k] = v
+    for list_item in data:
+        filtered_list_item: Dict[str, Any] = {}
+        for (k, v) in list_item.items():
+            if k in data_filters:
+                filtered_list_item[k] = v
 
-            output_data.append(filtered_list_item)
+        output_data.append(filtered_list_item)
 
-        return output_data
+    return output_data
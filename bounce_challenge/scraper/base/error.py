@@ -2,5 +2,13 @@ from enum import Enum, unique
 
 @unique
 class ScraperError(Enum):
+    # any status code without a dedicated member
+    UNEXPECTED_STATUS = 0
     UNAUTHORIZED = 401
-    RESOURCE_NOT_FOUND = 404
\ No newline at end of file
+    FORBIDDEN = 403
+    RESOURCE_NOT_FOUND = 404
+    TOO_MANY_REQUESTS = 429
+    INTERNAL_SERVER_ERROR = 500
+    BAD_GATEWAY = 502
+    SERVICE_UNAVAILABLE = 503
+    GATEWAY_TIMEOUT = 504
\ No newline at end of file
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import zipfile
+from collections import defaultdict, deque
+from datetime import timedelta
+from enum import Enum, unique
+from typing import TYPE_CHECKING
+
+from requests import Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.exceptions import RequestException
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from bounce_challenge.scraper.base.concurrency_controller import \
+    DEFAULT_MAX_LIMIT
+
+if TYPE_CHECKING:
+    from typing import Any, Deque, Dict, List, Optional, Tuple
+
+    from requests import PreparedRequest
+
+# the archive index, holding every exchange without its body
+_INDEX_FILE_NAME: str = "index.json"
+# bodies are stored decoded, hence transport specific headers must not be replayed
+_DROPPED_HEADERS: Tuple[str, ...] = ("content-encoding", "content-length", "transfer-encoding")
+
+
+@unique
+class ReplayLatencyMode(Enum):
+    NONE = "none"
+    RECORDED = "recorded"
+    SCALED = "scaled"
+
+
+class HttpArchiveRecorder(HTTPAdapter):
+    """Transport adapter performing real requests while recording every exchange
+        (status, headers including Link and rate limits, body and latency)
+        into a compressed archive once saved or closed, unchanged recordings being saved once.
+    """
+
+    def __init__(self: HttpArchiveRecorder, archive_path: str, **kwargs) -> None:
+        """Instantiates a HttpArchiveRecorder
+
+        Parameters
+        ----------
+        archive_path : str
+            The local filesystem path in which to store the archive
+        kwargs : Dict[str, Any]
+            The list of kwargs to be passed onto the HTTPAdapter.
+            The pool is sized for the default concurrency limit unless pool_maxsize is provided.
+        """
+        kwargs.setdefault("pool_connections", 1)
+        kwargs.setdefault("pool_maxsize", DEFAULT_MAX_LIMIT)
+        super().__init__(**kwargs)
+
+        self._archive_path = archive_path
+        self._exchanges: List[Tuple[Dict[str, Any], bytes]] = []
+        self._saved_exchanges: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def send(self: HttpArchiveRecorder, request: PreparedRequest, **kwargs) -> Response:
+        # the response elapsed time is only set by the session once the adapter returns
+        request_start: float = time.perf_counter()
+        response: Response = super().send(request, **kwargs)
+        # accessing content reads the whole (decoded) body, which is kept for later reads
+        body: bytes = response.content
+        elapsed: float = time.perf_counter() - request_start
+
+        exchange: Dict[str, Any] = {
+            "method": request.method,
+            "url": request.url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for (k, v) in response.headers.items() if k.lower() not in _DROPPED_HEADERS},
+            "elapsed": elapsed
+        }
+
+        with self._lock:
+            self._exchanges.append((exchange, body))
+
+        return response
+
+    def save(self: HttpArchiveRecorder) -> None:
+        """Stores the recorded exchanges onto the archive path
+        """
+        with self._lock:
+            # exchanges are only ever appended, hence an unchanged count means an unchanged recording
+            if self._saved_exchanges == len(self._exchanges):
+                return
+
+            exchanges: List[Tuple[Dict[str, Any], bytes]] = list(self._exchanges)
+
+        with zipfile.ZipFile(self._archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for (exchange_id, (_, body)) in enumerate(exchanges):
+                archive.writestr(f"bodies/{exchange_id}", body)
+
+            archive.writestr(_INDEX_FILE_NAME, json.dumps([exchange for (exchange, _) in exchanges]))
+
+        with self._lock:
+            self._saved_exchanges = len(exchanges)
+
+        logging.info(f"Recorded {len(exchanges)} exchanges into {self._archive_path}")
+
+    def close(self: HttpArchiveRecorder) -> None:
+        self.save()
+        super().close()
+
+
+class HttpArchiveReplayer(BaseAdapter):
+    """Transport adapter serving the responses of a recorded archive without network access.
+        Exchanges recorded for the same request are served in their recorded order,
+        the last one being repeated once exhausted.
+    """
+
+    def __init__(self: HttpArchiveReplayer, archive_path: str,
+                 latency_mode: ReplayLatencyMode = ReplayLatencyMode.NONE, latency_scale: float = 1.0) -> None:
+        """Instantiates a HttpArchiveReplayer
+
+        Parameters
+        ----------
+        archive_path : str
+            The local filesystem path of the recorded archive
+        latency_mode : ReplayLatencyMode, optional
+            Serve responses instantly, with the recorded latency or with the scaled recorded latency,
+            by default ReplayLatencyMode.NONE
+        latency_scale : float, optional
+            The factor applied to the recorded latency in the scaled mode, by default 1.0
+        """
+        super().__init__()
+
+        self._latency_mode = latency_mode
+        self._latency_scale = latency_scale
+        self._exchanges: Dict[Tuple[str, str], Deque[Tuple[Dict[str, Any], bytes]]] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+        with zipfile.ZipFile(archive_path, "r") as archive:
+            index: List[Dict[str, Any]] = json.loads(archive.read(_INDEX_FILE_NAME))
+
+            for (exchange_id, exchange) in enumerate(index):
+                self._exchanges[(exchange["method"], exchange["url"])].append(
+                    (exchange, archive.read(f"bodies/{exchange_id}")))
+
+        logging.info(f"Loaded {len(index)} exchanges from {archive_path}")
+
+    def send(self: HttpArchiveReplayer, request: PreparedRequest, **kwargs) -> Response:
+        with self._lock:
+            recorded_exchanges: Deque[Tuple[Dict[str, Any], bytes]] = self._exchanges.get(
+                (request.method, request.url))
+
+            if not recorded_exchanges:
+                # not a connection error, as retrying a replay miss can't succeed
+                raise RequestException(
+                    f"No recorded response for {request.method} {request.url}", request=request)
+
+            (exchange, body) = recorded_exchanges.popleft() if len(
+                recorded_exchanges) > 1 else recorded_exchanges[0]
+
+        match self._latency_mode:
+            case ReplayLatencyMode.RECORDED:
+                time.sleep(exchange["elapsed"])
+            case ReplayLatencyMode.SCALED:
+                time.sleep(exchange["elapsed"] * self._latency_scale)
+            case _:
+                pass
+
+        return self._build_response(request=request, exchange=exchange, body=body)
+
+    def _build_response(self: HttpArchiveReplayer, request: PreparedRequest, exchange: Dict[str, Any], body: bytes) -> Response:
+        response: Response = Response()
+        response.status_code = exchange["status_code"]
+        response.reason = exchange["reason"]
+        response.headers = CaseInsensitiveDict(exchange["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(seconds=exchange["elapsed"])
+        response.url = request.url
+        response.request = request
+        response._content = body
+
+        return response
+
+    def close(self: HttpArchiveReplayer) -> None:
+        pass
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+@dataclass
+class PipelineStage:
+    """Represents a step of a Pipeline, applying function to every item using workers threads
+    """
+    name: str
+    function: Callable[[Any], Any]
+    workers: int = 1
+
+
+class _StageFailure():
+    """Wraps an error raised by a stage, carried downstream in place of the item
+    """
+
+    def __init__(self: _StageFailure, stage_name: str, error: BaseException) -> None:
+        self.stage_name = stage_name
+        self.error = error
+
+
+# marks the end of the items on a queue
+_END_OF_ITEMS: object = object()
+
+
+class Pipeline():
+    """Runs items through a sequence of stages connected by bounded queues,
+        overlapping the work of every stage (e.g. network, CPU and disk).
+
+        Items are handed to the sink in their source order, and the amount of items
+        in flight is bounded, meaning a slow stage applies backpressure up to the source.
+    """
+
+    def __init__(self: Pipeline, stages: List[PipelineStage], queue_size: int = 8) -> None:
+        """Instantiates a Pipeline
+
+        Parameters
+        ----------
+        stages : List[PipelineStage]
+            The ordered list of stages each item goes through
+        queue_size : int, optional
+            The maximum amount of items waiting between two stages, by default 8
+        """
+        if not stages:
+            raise ValueError("A pipeline requires at least one stage")
+
+        self._stages = stages
+        self._queue_size = queue_size
+
+    def run(self: Pipeline, items: Iterable[Any], sink: Callable[[Any], None]) -> None:
+        """Runs all items through the stages, handing the results to the sink
+
+        Parameters
+        ----------
+        items : Iterable[Any]
+            The source items, consumed lazily
+        sink : Callable[[Any], None]
+            Called with every result in the source order, from the calling thread
+
+        Raises
+        ------
+        BaseException
+            Re-raises the first error raised by the source, a stage or the sink,
+            once the pipeline has been drained
+        """
+        queues: List[queue.Queue] = [queue.Queue(maxsize=self._queue_size)
+                                     for _ in range(len(self._stages) + 1)]
+        # bounds the items held anywhere in the pipeline, including the ones waiting to be reordered
+        max_in_flight: int = self._queue_size * len(queues) + sum(stage.workers for stage in self._stages)
+        in_flight: threading.BoundedSemaphore = threading.BoundedSemaphore(max_in_flight)
+        abort: threading.Event = threading.Event()
+        source_errors: List[BaseException] = []
+
+        threads: List[threading.Thread] = [threading.Thread(
+            target=self._feed, args=(items, queues[0], in_flight, abort, source_errors), daemon=True)]
+
+        for (stage_index, stage) in enumerate(self._stages):
+            next_stage_workers: int = self._stages[stage_index + 1].workers if stage_index + 1 < len(self._stages) else 1
+            finished_workers: List[int] = [0]
+            finished_lock: threading.Lock = threading.Lock()
+
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[stage_index], queues[stage_index + 1],
+                          next_stage_workers, finished_workers, finished_lock),
+                    daemon=True
+                ))
+
+        for thread in threads:
+            thread.start()
+
+        first_error: Optional[BaseException] = self._drain(
+            output_queue=queues[-1], sink=sink, in_flight=in_flight, abort=abort)
+
+        for thread in threads:
+            thread.join()
+
+        if source_errors:
+            raise source_errors[0]
+
+        if first_error is not None:
+            raise first_error
+
+    def _feed(self: Pipeline, items: Iterable[Any], input_queue: queue.Queue, in_flight: threading.BoundedSemaphore,
+              abort: threading.Event, source_errors: List[BaseException]) -> None:
+        try:
+            for (sequence, item) in enumerate(items):
+                # wait for room in the pipeline, giving up once it has been aborted
+                while not in_flight.acquire(timeout=0.1):
+                    if abort.is_set():
+                        return
+
+                if abort.is_set():
+                    in_flight.release()
+                    return
+
+                input_queue.put((sequence, item))
+        except BaseException as error:
+            source_errors.append(error)
+        finally:
+            for _ in range(self._stages[0].workers):
+                input_queue.put(_END_OF_ITEMS)
+
+    def _work(self: Pipeline, stage: PipelineStage, input_queue: queue.Queue, output_queue: queue.Queue,
+              next_stage_workers: int, finished_workers: List[int], finished_lock: threading.Lock) -> None:
+        while True:
+            entry: Any = input_queue.get()
+
+            if entry is _END_OF_ITEMS:
+                break
+
+            (sequence, item) = entry
+
+            if not isinstance(item, _StageFailure):
+                try:
+                    item = stage.function(item)
+                except BaseException as error:
+                    item = _StageFailure(stage_name=stage.name, error=error)
+
+            output_queue.put((sequence, item))
+
+        # the last worker of the stage to finish signals the end of the items to the next stage
+        with finished_lock:
+            finished_workers[0] += 1
+            is_last_worker: bool = finished_workers[0] == stage.workers
+
+        if is_last_worker:
+            for _ in range(next_stage_workers):
+                output_queue.put(_END_OF_ITEMS)
+
+    def _drain(self: Pipeline, output_queue: queue.Queue, sink: Callable[[Any], None],
+               in_flight: threading.BoundedSemaphore, abort: threading.Event) -> Optional[BaseException]:
+        pending_results: Dict[int, Any] = {}
+        next_sequence: int = 0
+        first_error: Optional[BaseException] = None
+
+        while True:
+            entry: Any = output_queue.get()
+
+            if entry is _END_OF_ITEMS:
+                return first_error
+
+            (sequence, result) = entry
+            pending_results[sequence] = result
+
+            # hand over the results in their source order
+            while next_sequence in pending_results:
+                result: Any = pending_results.pop(next_sequence)
+                next_sequence += 1
+                in_flight.release()
+
+                if first_error is not None:
+                    # keep draining so that every thread can finish
+                    continue
+
+                if isinstance(result, _StageFailure):
+                    first_error = result.error
+                    abort.set()
+                    continue
+
+                try:
+                    sink(result)
+                except BaseException as error:
+                    first_error = error
+                    abort.set()
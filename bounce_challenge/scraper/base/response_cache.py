@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+# marks a body which has not been decoded yet
+_NOT_DECODED: object = object()
+
+
+@dataclass
+class DecodedResponse:
+    """Holds the parts of a response required by the scrapers.
+        The JSON body is decoded on first access, the decoded data being kept
+        and shared with every consumer of the response, and the raw content released.
+    """
+    status_code: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    links: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    content: bytes = b""
+    _data: Any = field(default=_NOT_DECODED, init=False, repr=False, compare=False)
+    _decode_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def data(self: DecodedResponse) -> Any:
+        """Returns the decoded JSON body
+
+        Returns
+        -------
+        Any
+            The decoded body, None if the response holds no content
+        """
+        if self._data is _NOT_DECODED:
+            with self._decode_lock:
+                if self._data is _NOT_DECODED:
+                    self._data = json.loads(self.content) if self.content else None
+                    # cached responses would otherwise hold both the raw and the decoded body
+                    self.content = b""
+
+        return self._data
+
+
+class _InFlightRequest():
+    """Represents a request being fetched, on which concurrent identical requests wait
+    """
+
+    def __init__(self: _InFlightRequest) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache():
+    """Coalesces concurrent identical requests into a single fetch (single-flight)
+        and memoizes recent results in a time bounded LRU.
+    """
+
+    def __init__(self: ResponseCache, max_entries: int = 256, ttl_seconds: float = 60.0) -> None:
+        """Instantiates a ResponseCache
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum amount of memoized results, the least recently used being evicted first, by default 256
+        ttl_seconds : float, optional
+            The amount of seconds a memoized result is served for, by default 60.0
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._in_flight: Dict[Hashable, _InFlightRequest] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self: ResponseCache, key: Hashable, fetch: Callable[[], Any],
+                     is_cacheable: Callable[[Any], bool] = None) -> Any:
+        """Returns the memoized result for the key, joins an identical in-flight fetch
+            or otherwise fetches it.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key identifying the request
+        fetch : Callable[[], Any]
+            The function performing the request
+        is_cacheable : Callable[[Any], bool], optional
+            Decides whether a fetched result is memoized, by default every result is
+
+        Returns
+        -------
+        Any
+            The fetched or memoized result, shared between all callers
+        """
+        with self._lock:
+            entry: Optional[Tuple[float, Any]] = self._entries.get(key)
+
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return entry[1]
+
+                del self._entries[key]
+
+            in_flight_request: Optional[_InFlightRequest] = self._in_flight.get(key)
+            is_leader: bool = in_flight_request is None
+
+            if is_leader:
+                in_flight_request = _InFlightRequest()
+                self._in_flight[key] = in_flight_request
+
+        if not is_leader:
+            in_flight_request.done.wait()
+
+            if in_flight_request.error is not None:
+                raise in_flight_request.error
+
+            return in_flight_request.result
+
+        try:
+            in_flight_request.result = fetch()
+        except BaseException as error:
+            in_flight_request.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+                if in_flight_request.error is None and (is_cacheable is None or is_cacheable(in_flight_request.result)):
+                    self._store(key=key, result=in_flight_request.result)
+
+            in_flight_request.done.set()
+
+        return in_flight_request.result
+
+    def clear(self: ResponseCache) -> None:
+        """Removes all memoized results
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self: ResponseCache, key: Hashable, result: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, result)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
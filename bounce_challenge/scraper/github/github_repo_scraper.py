@@ -1,22 +1,39 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from itertools import chain
 from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.compat import urljoin
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout
 
 from bounce_challenge.scraper.base.auth_method import AuthMethodToken
-from bounce_challenge.scraper.base.data_accumulator import (DataAccumulator,
-                                                            DataOutputType)
+from bounce_challenge.scraper.base.concurrency_controller import \
+    AdaptiveConcurrencyController
+from bounce_challenge.scraper.base.data_accumulator import (
+    DataOutputType, StreamingDataWriter, project_data)
 from bounce_challenge.scraper.base.error import ScraperError
+from bounce_challenge.scraper.base.pipeline import Pipeline, PipelineStage
+from bounce_challenge.scraper.base.response_cache import (DecodedResponse,
+                                                          ResponseCache)
 from bounce_challenge.scraper.base.scraper import BaseScraper
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Dict, List, Optional, Type
+    from typing import (Any, Callable, Dict, Iterable, Iterator, List,
+                        Optional, Tuple, Type)
+    from urllib.parse import ParseResult
 
     from requests import Response
+    from requests.adapters import BaseAdapter
 
 
 class GithubRepoScraper(BaseScraper):
@@ -24,11 +41,30 @@ class GithubRepoScraper(BaseScraper):
     _API_URL = 'https://api.github.com'
     _USER_REPOSITORIES_URL: str = "search/repositories?q=user:{username}"
     _SCRAPER_NAME: str = "github_repo_scraper"
-
-    def __init__(self, auth_method: Any = None) -> None:
+    _MAX_RETRIES: int = 3
+    # the (connect, read) timeouts in seconds, so that stalled requests are retried instead of hanging
+    _REQUEST_TIMEOUT: Tuple[float, float] = (10.0, 60.0)
+    _RATE_LIMIT_STATUS_CODES: Tuple[int, ...] = (403, 429)
+    # the delay in seconds applied on rate limits providing neither Retry-After nor a reset time
+    _RATE_LIMIT_DELAY: float = 60.0
+    # the amount of threads of the pipeline stages, the fetch stage being sized by the concurrency controller
+    _DECODE_WORKERS: int = 1
+    _PROJECT_WORKERS: int = 1
+    # the maximum amount of pages waiting between two pipeline stages
+    _PIPELINE_QUEUE_SIZE: int = 8
+    # shared by all instances so that concurrent jobs within a process reuse each other's pages
+    _RESPONSE_CACHE: ResponseCache = ResponseCache()
+
+    def __init__(self, auth_method: Any = None, concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+                 response_cache: Optional[ResponseCache] = None, session_adapter: Optional[BaseAdapter] = None) -> None:
         super().__init__(scraper_name=GithubRepoScraper._SCRAPER_NAME)
 
         self._auth_method = auth_method
+        # adapts the amount of in-flight page requests to the observed latency and throttling
+        self._concurrency_controller = concurrency_controller or AdaptiveConcurrencyController()
+        self._response_cache = response_cache or GithubRepoScraper._RESPONSE_CACHE
+        # an optional transport adapter mounted on every session, e.g. to record or replay the traffic
+        self._session_adapter = session_adapter
 
     def start(self, **kwargs) -> bool:
         """Initiates the process of scraping.
@@ -50,7 +86,7 @@ class GithubRepoScraper(BaseScraper):
         """
 
         session: Session = self._authenticate(
-        ) if self._auth_method is not None else Session()
+        ) if self._auth_method is not None else self._create_session()
 
         github_user: str = kwargs.get("user")
         output_path: str = kwargs.get("output_path")
@@ -65,14 +101,11 @@ class GithubRepoScraper(BaseScraper):
         # generate the Github user profile link
         user_profile_link: str = self._build_user_repository_url(
             user_name=github_user)
-        # create a DataAccumulator instance to hold all the extracted information
-        data_accumulator: DataAccumulator = DataAccumulator()
-        # exhaust all API requests
-        self._exhaust_requests(target_url=user_profile_link, session=session,
-                               output_callback=data_accumulator.add_json_data)
-        # dump the provided information as a CSV
-        data_accumulator.dump(
-            output_path=output_path, output_type=DataOutputType.CSV, data_filters=data_filters)
+        # write the extracted information as a CSV while the pages are being requested
+        with StreamingDataWriter(output_path=output_path, output_type=DataOutputType.CSV) as data_writer:
+            # exhaust all API requests
+            self._exhaust_requests(target_url=user_profile_link, session=session,
+                                   output_callback=data_writer.write, data_filters=data_filters)
 
         return True
 
@@ -84,38 +117,238 @@ class GithubRepoScraper(BaseScraper):
 
         return user_profile_link
 
-    def _exhaust_requests(self: Type[BaseScraper], target_url: str, session: Session, output_callback: Callable[..., Any] = None) -> Session:
-        response: Response = session.get(url=target_url)
-        # extract the content containing the data
-        url_data = response.content
+    def _exhaust_requests(self: Type[BaseScraper], target_url: str, session: Session, output_callback: Callable[..., Any] = None,
+                          data_filters: Optional[List[str]] = None) -> None:
+        first_page: DecodedResponse = self._get_page(target_url=target_url, session=session)
+        self._validate_response(response=first_page)
+
+        # page numbered responses expose the last page, allowing the remaining pages to be fetched concurrently,
+        # whereas cursor based ones are fetched sequentially by the source while the remaining stages keep working
+        remaining_page_urls: List[str] = self._get_remaining_page_urls(response=first_page)
+        pages: Iterable[Any] = chain([first_page], remaining_page_urls) if remaining_page_urls else \
+            self._iter_cursor_pages(first_page=first_page, session=session)
+
+        # overlap the network, decoding, projection and writing of the pages, the output keeping the page order
+        pipeline: Pipeline = Pipeline(stages=[
+            PipelineStage(name="fetch", function=partial(self._fetch_stage, session=session),
+                          workers=self._concurrency_controller.max_limit),
+            PipelineStage(name="decode", function=self._decode_stage,
+                          workers=GithubRepoScraper._DECODE_WORKERS),
+            PipelineStage(name="project", function=partial(project_data, data_filters=data_filters),
+                          workers=GithubRepoScraper._PROJECT_WORKERS)
+        ], queue_size=GithubRepoScraper._PIPELINE_QUEUE_SIZE)
         # pass the extracted information to the callable
-        output_callback(data=json.loads(url_data).get("items"))
+        pipeline.run(items=pages, sink=lambda data: output_callback(data=data))
 
-        if self._validate_response(response=response):
-            next_page_url: str = self._get_next_page(session=session)
+        logging.info(
+            f"Exhausted all requests, concurrency limit at {self._concurrency_controller.limit}")
 
-            if next_page_url:
-                if self._is_valid_url(target_url=next_page_url):
-                    self._exhaust_requests(
-                        target_url=next_page_url,
-                        session=session,
-                        output_callback=output_callback
-                    )
+    def _iter_cursor_pages(self: Type[BaseScraper], first_page: DecodedResponse, session: Session) -> Iterator[DecodedResponse]:
+        page: DecodedResponse = first_page
+
+        while True:
+            yield page
+
+            next_page_url: Optional[str] = self._get_next_page(response=page)
+
+            if not next_page_url:
+                return
+
+            if not self._is_valid_url(target_url=next_page_url):
+                logging.warning(f"Skipping invalid URL {next_page_url}")
+                return
+
+            page = self._get_page(target_url=next_page_url, session=session)
+
+    def _fetch_stage(self: Type[BaseScraper], page: Any, session: Session) -> DecodedResponse:
+        # pages may be provided already fetched, e.g. the first page or cursor based pages
+        if isinstance(page, DecodedResponse):
+            return page
+
+        return self._get_page(target_url=page, session=session)
+
+    def _decode_stage(self: Type[BaseScraper], page: DecodedResponse) -> List[Dict[str, Any]]:
+        self._validate_response(response=page)
+
+        return page.data.get("items", [])
+
+    def _get_page(self: Type[BaseScraper], target_url: str, session: Session) -> DecodedResponse:
+        """Returns the page, coalescing identical concurrent requests
+            and reusing recently fetched pages for the same auth identity
+
+        Parameters
+        ----------
+        target_url : str
+            The page url to be requested
+        session : Session
+            The session through which to request the page
+
+        Returns
+        -------
+        DecodedResponse
+            The page, shared between all callers and therefore not to be mutated
+        """
+        return self._response_cache.get_or_fetch(
+            key=(target_url, self._get_auth_identity(session=session)),
+            fetch=lambda: self._read_response(
+                response=self._fetch_page(target_url=target_url, session=session)),
+            # failed responses are shared with in-flight callers but never memoized
+            is_cacheable=lambda decoded_response: decoded_response.status_code < 300
+        )
+
+    def _get_auth_identity(self: Type[BaseScraper], session: Session) -> str:
+        # hash the credentials so that no token is kept in the cache keys
+        authorization: str = session.headers.get("authorization", "")
+
+        return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+
+    def _read_response(self: Type[BaseScraper], response: Response) -> DecodedResponse:
+        # the body is decoded lazily, within the decode stage
+        return DecodedResponse(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            links=response.links,
+            content=response.content
+        )
+
+    def _fetch_page(self: Type[BaseScraper], target_url: str, session: Session) -> Response:
+        """Requests a page within the limits of the concurrency controller,
+            retrying throttled responses and transport errors (connection errors, timeouts)
+
+        Parameters
+        ----------
+        target_url : str
+            The page url to be requested
+        session : Session
+            The session through which to request the page
+
+        Returns
+        -------
+        Response
+            The last response received, which may still be throttled once retries are exhausted
+
+        Raises
+        ------
+        RequestsConnectionError
+            The last transport error once retries are exhausted, timeouts included
+        """
+        for attempt in range(GithubRepoScraper._MAX_RETRIES + 1):
+            response: Optional[Response] = None
+            transport_error: Optional[Exception] = None
+
+            with self._concurrency_controller.slot() as backoff_epoch:
+                request_start: float = time.perf_counter()
+
+                try:
+                    response = session.get(url=target_url, timeout=GithubRepoScraper._REQUEST_TIMEOUT)
+                except (RequestsConnectionError, Timeout) as error:
+                    transport_error = error
+                    self._concurrency_controller.record_error(error=error, backoff_epoch=backoff_epoch)
                 else:
-                    logging.warning(f"Skipping invalid URL {next_page_url}")
+                    self._concurrency_controller.record(
+                        status_code=response.status_code,
+                        latency=time.perf_counter() - request_start,
+                        backoff_epoch=backoff_epoch
+                    )
+
+            if transport_error is not None:
+                if attempt == GithubRepoScraper._MAX_RETRIES:
+                    raise transport_error
+
+                retry_after: float = float(2 ** attempt)
+                retry_reason: str = repr(transport_error)
+            else:
+                if not self._is_retryable(response=response) or attempt == GithubRepoScraper._MAX_RETRIES:
+                    return response
+
+                # honor the rate limit hints when provided
+                retry_after: float = self._get_retry_delay(response=response, attempt=attempt)
+                retry_reason: str = f"status {response.status_code}"
+
+            # wait outside of the slot
+            logging.warning(f"Retrying {target_url} in {retry_after}s after {retry_reason}")
+            time.sleep(retry_after)
+
+    def _get_retry_delay(self: Type[BaseScraper], response: Response, attempt: int) -> float:
+        retry_after: Optional[str] = response.headers.get("retry-after")
+
+        if retry_after:
+            retry_delay: Optional[float] = self._parse_retry_after(retry_after=retry_after)
+
+            if retry_delay is not None:
+                return retry_delay
+
+        if self._is_rate_limited(response=response):
+            # the primary rate limit resets at the provided epoch
+            try:
+                return max(0.0, float(response.headers["x-ratelimit-reset"]) - time.time())
+            except (KeyError, ValueError):
+                pass
+
+        if response.status_code in GithubRepoScraper._RATE_LIMIT_STATUS_CODES:
+            # Github requires waiting at least one minute on rate limits providing no hint
+            return GithubRepoScraper._RATE_LIMIT_DELAY
+
+        # defaults to an exponential delay on server errors
+        return float(2 ** attempt)
+
+    def _parse_retry_after(self: Type[BaseScraper], retry_after: str) -> Optional[float]:
+        # Retry-After holds either an amount of seconds or an HTTP date
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            retry_date: datetime = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            logging.warning(f"Ignoring invalid Retry-After header {retry_after}")
+            return None
 
-        logging.info("Exhausted all requests")
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
 
-    def _get_next_page(self: Type[BaseScraper], session: Session) -> Optional[Session]:
-        return session if session.headers.get('link') else None
+        return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
 
-    def _validate_response(self: Type[BaseScraper], response: Response) -> bool:
+    def _is_rate_limited(self: Type[BaseScraper], response: Response) -> bool:
+        return response.status_code in GithubRepoScraper._RATE_LIMIT_STATUS_CODES and \
+            response.headers.get("x-ratelimit-remaining") == "0"
+
+    def _is_retryable(self: Type[BaseScraper], response: Response) -> bool:
+        status_code: int = response.status_code
+
+        # a 403 is only a throttling signal when Github hints a retry or the rate limit is exhausted,
+        # otherwise access is forbidden
+        return status_code == 429 or status_code >= 500 or \
+            (status_code == 403 and ("retry-after" in response.headers or self._is_rate_limited(response=response)))
+
+    def _get_remaining_page_urls(self: Type[BaseScraper], response: DecodedResponse) -> List[str]:
+        last_page_url: Optional[str] = response.links.get("last", {}).get("url")
+
+        if not last_page_url:
+            return []
+
+        parsed_url: ParseResult = urlparse(last_page_url)
+        query: Dict[str, List[str]] = parse_qs(parsed_url.query)
+        last_page: int = int(query.get("page", ["1"])[0])
+        page_urls: List[str] = []
+
+        for page in range(2, last_page + 1):
+            query["page"] = [str(page)]
+            page_urls.append(urlunparse(parsed_url._replace(query=urlencode(query, doseq=True))))
+
+        return page_urls
+
+    def _get_next_page(self: Type[BaseScraper], response: DecodedResponse) -> Optional[str]:
+        return response.links.get("next", {}).get("url")
+
+    def _validate_response(self: Type[BaseScraper], response: DecodedResponse) -> bool:
         """Validates the provided request response based on its status code
 
         Parameters
         ----------
-        response : Response
-            The Response instance to be validated
+        response : DecodedResponse
+            The decoded response to be validated
 
         Returns
         -------
@@ -127,7 +360,13 @@ class GithubRepoScraper(BaseScraper):
         if response_code < 300:
             return True
 
-        return self._handle_error(error=ScraperError(response_code))
+        try:
+            error: ScraperError = ScraperError(response_code)
+        except ValueError:
+            logging.error(f"Received unexpected status code {response_code}")
+            error: ScraperError = ScraperError.UNEXPECTED_STATUS
+
+        return self._handle_error(error=error)
 
     def _is_valid_url(self: Type[BaseScraper], target_url: str) -> bool:
         """Validates a target link.
@@ -162,7 +401,7 @@ class GithubRepoScraper(BaseScraper):
 
         if isinstance(auth_method, AuthMethodToken):
             # sessions persist headers between requests
-            session: Session = Session()
+            session: Session = self._create_session()
 
             # Add Github token
             github_token: str = auth_method.token
@@ -178,6 +417,18 @@ class GithubRepoScraper(BaseScraper):
             raise NotImplementedError(
                 f"Authentication not implemented for method {auth_method}")
 
+    def _create_session(self: Type[BaseScraper]) -> Session:
+        session: Session = Session()
+
+        # the default pool holds 10 connections, fewer than the concurrent page requests
+        session_adapter: BaseAdapter = self._session_adapter or HTTPAdapter(
+            pool_connections=1, pool_maxsize=self._concurrency_controller.max_limit)
+
+        session.mount("https://", session_adapter)
+        session.mount("http://", session_adapter)
+
+        return session
+
     @classmethod
     def from_json(cls: Type[BaseScraper], json_config: Dict[str, str]) -> Type[BaseScraper]:
         """Generates an instance of the GithubRepoScraper based on the provided JSON imput
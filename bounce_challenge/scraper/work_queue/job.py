@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from enum import Enum, unique
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List, Optional
+
+
+@unique
+class JobStatus(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class ScraperJob:
+    """Represents a single unit of scraping work held in a job store
+    """
+    scraper_name: str
+    user_name: str
+    output_path: str
+    data_filters: List[str] = field(default_factory=list)
+    job_id: Optional[int] = None
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    result: Optional[str] = None
+    error: Optional[str] = None
@@ -0,0 +1,448 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import replace
+from enum import Enum, unique
+from typing import TYPE_CHECKING
+
+from bounce_challenge.scraper.work_queue.job import JobStatus, ScraperJob
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterator, List, Optional, Type
+
+
+@unique
+class JobStoreTypes(Enum):
+    """
+        Represents the list of available job stores and the corresponding url scheme
+    """
+    SQLITE = "sqlite"
+    MEMORY = "memory"
+
+
+class BaseJobStore(ABC):
+    """Represents an abstract shared store of scraping jobs.
+        Jobs are claimed through expiring leases, meaning a job whose worker stops
+        heartbeating is handed to another worker (at-least-once semantics).
+    """
+
+    # the error recorded for jobs whose lease expired on their last allowed attempt
+    _LEASE_EXPIRED_ERROR: str = "lease expired"
+
+    def __init__(self, max_attempts: int = 3) -> None:
+        """Instantiates an instance of the abstract class BaseJobStore
+
+        Parameters
+        ----------
+        max_attempts : int, optional
+            The number of claims a job is allowed before being marked as failed,
+            either through failures or expired leases, by default 3
+        """
+        self._max_attempts = max_attempts
+
+    @abstractmethod
+    def enqueue(self: Type[BaseJobStore], job: ScraperJob) -> int:
+        """Adds a job to the store in the pending state
+
+        Parameters
+        ----------
+        job : ScraperJob
+            The job to be enqueued
+
+        Returns
+        -------
+        int
+            The identifier assigned to the job
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def claim(self: Type[BaseJobStore], worker_id: str, lease_seconds: float) -> Optional[ScraperJob]:
+        """Claims the next available job, either pending or whose lease has expired
+
+        Parameters
+        ----------
+        worker_id : str
+            The identifier of the claiming worker
+        lease_seconds : float
+            The amount of seconds the lease is valid for without a heartbeat
+
+        Returns
+        -------
+        Optional[ScraperJob]
+            The claimed job, None if no job is available
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def heartbeat(self: Type[BaseJobStore], job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """Extends the lease of a job held by the worker
+
+        Parameters
+        ----------
+        job_id : int
+            The identifier of the job
+        worker_id : str
+            The identifier of the worker holding the lease
+        lease_seconds : float
+            The amount of seconds the lease is extended for
+
+        Returns
+        -------
+        bool
+            True if the worker still holds the lease
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def complete(self: Type[BaseJobStore], job_id: int, worker_id: str, result: str) -> bool:
+        """Records the job as successfully completed
+
+        Parameters
+        ----------
+        job_id : int
+            The identifier of the job
+        worker_id : str
+            The identifier of the worker holding the lease
+        result : str
+            The result to be recorded
+
+        Returns
+        -------
+        bool
+            True if the worker still held the lease and the result was recorded
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def fail(self: Type[BaseJobStore], job_id: int, worker_id: str, error: str) -> bool:
+        """Records a job failure, re-queueing it while attempts remain
+
+        Parameters
+        ----------
+        job_id : int
+            The identifier of the job
+        worker_id : str
+            The identifier of the worker holding the lease
+        error : str
+            The error description to be recorded
+
+        Returns
+        -------
+        bool
+            True if the worker still held the lease and the failure was recorded
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_jobs(self: Type[BaseJobStore], status: Optional[JobStatus] = None) -> List[ScraperJob]:
+        """Returns the jobs held by the store
+
+        Parameters
+        ----------
+        status : Optional[JobStatus], optional
+            Only return jobs with the provided status, by default None
+
+        Returns
+        -------
+        List[ScraperJob]
+            The list of jobs
+        """
+        raise NotImplementedError()
+
+    def _next_failed_status(self: Type[BaseJobStore], attempts: int) -> JobStatus:
+        return JobStatus.PENDING if attempts < self._max_attempts else JobStatus.FAILED
+
+
+class SqliteJobStore(BaseJobStore):
+    """Job store backed by a SQLite file, meant to be placed on a volume shared by all workers
+    """
+
+    _CREATE_TABLE_QUERY: str = """
+        CREATE TABLE IF NOT EXISTS scraper_jobs (
+            job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            scraper_name TEXT NOT NULL,
+            user_name TEXT NOT NULL,
+            output_path TEXT NOT NULL,
+            data_filters TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker_id TEXT,
+            lease_expires_at REAL,
+            result TEXT,
+            error TEXT
+        )
+    """
+
+    def __init__(self, database_path: str, max_attempts: int = 3, timeout: float = 30.0) -> None:
+        super().__init__(max_attempts=max_attempts)
+
+        self._database_path = database_path
+        self._timeout = timeout
+
+        with self._connect() as connection:
+            connection.execute(SqliteJobStore._CREATE_TABLE_QUERY)
+
+    @contextmanager
+    def _connect(self: SqliteJobStore) -> Iterator[sqlite3.Connection]:
+        # a short lived connection per operation keeps the store safe to share between threads
+        # isolation_level=None leaves transaction handling to the explicit BEGIN statements
+        connection: sqlite3.Connection = sqlite3.connect(
+            self._database_path, timeout=self._timeout, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _transaction(self: SqliteJobStore, connection: sqlite3.Connection) -> Iterator[None]:
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("COMMIT")
+
+    def enqueue(self: SqliteJobStore, job: ScraperJob) -> int:
+        with self._connect() as connection:
+            cursor: sqlite3.Cursor = connection.execute(
+                "INSERT INTO scraper_jobs (scraper_name, user_name, output_path, data_filters, status) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job.scraper_name, job.user_name, job.output_path,
+                 json.dumps(job.data_filters), JobStatus.PENDING.value)
+            )
+
+            return cursor.lastrowid
+
+    def claim(self: SqliteJobStore, worker_id: str, lease_seconds: float) -> Optional[ScraperJob]:
+        now: float = time.time()
+
+        # BEGIN IMMEDIATE takes the write lock upfront so two workers never claim the same job
+        with self._connect() as connection, self._transaction(connection=connection):
+            # jobs whose last allowed attempt crashed its worker are not handed out again
+            connection.execute(
+                "UPDATE scraper_jobs SET status = ?, error = ?, lease_expires_at = NULL "
+                "WHERE status = ? AND lease_expires_at < ? AND attempts >= ?",
+                (JobStatus.FAILED.value, BaseJobStore._LEASE_EXPIRED_ERROR,
+                 JobStatus.RUNNING.value, now, self._max_attempts)
+            )
+            row: Optional[sqlite3.Row] = connection.execute(
+                "SELECT * FROM scraper_jobs "
+                "WHERE status = ? OR (status = ? AND lease_expires_at < ?) "
+                "ORDER BY job_id LIMIT 1",
+                (JobStatus.PENDING.value, JobStatus.RUNNING.value, now)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            connection.execute(
+                "UPDATE scraper_jobs SET status = ?, worker_id = ?, lease_expires_at = ?, "
+                "attempts = attempts + 1 WHERE job_id = ?",
+                (JobStatus.RUNNING.value, worker_id, now + lease_seconds, row["job_id"])
+            )
+
+        return replace(self._row_to_job(row=row), status=JobStatus.RUNNING, worker_id=worker_id,
+                       lease_expires_at=now + lease_seconds, attempts=row["attempts"] + 1)
+
+    def heartbeat(self: SqliteJobStore, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        with self._connect() as connection:
+            cursor: sqlite3.Cursor = connection.execute(
+                "UPDATE scraper_jobs SET lease_expires_at = ? "
+                "WHERE job_id = ? AND worker_id = ? AND status = ?",
+                (time.time() + lease_seconds, job_id, worker_id, JobStatus.RUNNING.value)
+            )
+
+            return cursor.rowcount > 0
+
+    def complete(self: SqliteJobStore, job_id: int, worker_id: str, result: str) -> bool:
+        with self._connect() as connection:
+            cursor: sqlite3.Cursor = connection.execute(
+                "UPDATE scraper_jobs SET status = ?, result = ?, error = NULL, lease_expires_at = NULL "
+                "WHERE job_id = ? AND worker_id = ? AND status = ?",
+                (JobStatus.DONE.value, result, job_id, worker_id, JobStatus.RUNNING.value)
+            )
+
+            return cursor.rowcount > 0
+
+    def fail(self: SqliteJobStore, job_id: int, worker_id: str, error: str) -> bool:
+        with self._connect() as connection, self._transaction(connection=connection):
+            row: Optional[sqlite3.Row] = connection.execute(
+                "SELECT attempts FROM scraper_jobs WHERE job_id = ? AND worker_id = ? AND status = ?",
+                (job_id, worker_id, JobStatus.RUNNING.value)
+            ).fetchone()
+
+            if row is None:
+                return False
+
+            connection.execute(
+                "UPDATE scraper_jobs SET status = ?, error = ?, lease_expires_at = NULL WHERE job_id = ?",
+                (self._next_failed_status(attempts=row["attempts"]).value, error, job_id)
+            )
+
+        return True
+
+    def get_jobs(self: SqliteJobStore, status: Optional[JobStatus] = None) -> List[ScraperJob]:
+        with self._connect() as connection:
+            if status is None:
+                rows: List[sqlite3.Row] = connection.execute(
+                    "SELECT * FROM scraper_jobs ORDER BY job_id").fetchall()
+            else:
+                rows: List[sqlite3.Row] = connection.execute(
+                    "SELECT * FROM scraper_jobs WHERE status = ? ORDER BY job_id", (status.value,)).fetchall()
+
+        return [self._row_to_job(row=row) for row in rows]
+
+    def _row_to_job(self: SqliteJobStore, row: sqlite3.Row) -> ScraperJob:
+        return ScraperJob(
+            job_id=row["job_id"],
+            scraper_name=row["scraper_name"],
+            user_name=row["user_name"],
+            output_path=row["output_path"],
+            data_filters=json.loads(row["data_filters"]),
+            status=JobStatus(row["status"]),
+            attempts=row["attempts"],
+            worker_id=row["worker_id"],
+            lease_expires_at=row["lease_expires_at"],
+            result=row["result"],
+            error=row["error"]
+        )
+
+
+class InMemoryJobStore(BaseJobStore):
+    """Process local job store, a stand-in for key-value backends (e.g. Redis)
+        sharing the same lease semantics. Mostly useful for local runs and testing.
+    """
+
+    def __init__(self, max_attempts: int = 3) -> None:
+        super().__init__(max_attempts=max_attempts)
+
+        self._jobs: Dict[int, ScraperJob] = {}
+        self._next_job_id: int = 1
+        self._lock = threading.Lock()
+
+    def enqueue(self: InMemoryJobStore, job: ScraperJob) -> int:
+        with self._lock:
+            job_id: int = self._next_job_id
+            self._next_job_id += 1
+            self._jobs[job_id] = replace(job, job_id=job_id, status=JobStatus.PENDING, attempts=0,
+                                         worker_id=None, lease_expires_at=None)
+
+            return job_id
+
+    def claim(self: InMemoryJobStore, worker_id: str, lease_seconds: float) -> Optional[ScraperJob]:
+        now: float = time.time()
+
+        with self._lock:
+            for job in self._jobs.values():
+                is_expired: bool = job.status == JobStatus.RUNNING and job.lease_expires_at < now
+
+                # jobs whose last allowed attempt crashed its worker are not handed out again
+                if is_expired and job.attempts >= self._max_attempts:
+                    job.status = JobStatus.FAILED
+                    job.error = BaseJobStore._LEASE_EXPIRED_ERROR
+                    job.lease_expires_at = None
+                    continue
+
+                if job.status == JobStatus.PENDING or is_expired:
+                    job.status = JobStatus.RUNNING
+                    job.worker_id = worker_id
+                    job.lease_expires_at = now + lease_seconds
+                    job.attempts += 1
+
+                    return replace(job)
+
+        return None
+
+    def heartbeat(self: InMemoryJobStore, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        with self._lock:
+            job: Optional[ScraperJob] = self._get_leased_job(job_id=job_id, worker_id=worker_id)
+
+            if job is None:
+                return False
+
+            job.lease_expires_at = time.time() + lease_seconds
+
+            return True
+
+    def complete(self: InMemoryJobStore, job_id: int, worker_id: str, result: str) -> bool:
+        with self._lock:
+            job: Optional[ScraperJob] = self._get_leased_job(job_id=job_id, worker_id=worker_id)
+
+            if job is None:
+                return False
+
+            job.status = JobStatus.DONE
+            job.result = result
+            job.error = None
+            job.lease_expires_at = None
+
+            return True
+
+    def fail(self: InMemoryJobStore, job_id: int, worker_id: str, error: str) -> bool:
+        with self._lock:
+            job: Optional[ScraperJob] = self._get_leased_job(job_id=job_id, worker_id=worker_id)
+
+            if job is None:
+                return False
+
+            job.status = self._next_failed_status(attempts=job.attempts)
+            job.error = error
+            job.lease_expires_at = None
+
+            return True
+
+    def get_jobs(self: InMemoryJobStore, status: Optional[JobStatus] = None) -> List[ScraperJob]:
+        with self._lock:
+            return [replace(job) for job in self._jobs.values() if status is None or job.status == status]
+
+    def _get_leased_job(self: InMemoryJobStore, job_id: int, worker_id: str) -> Optional[ScraperJob]:
+        job: Optional[ScraperJob] = self._jobs.get(job_id)
+
+        if job is None or job.status != JobStatus.RUNNING or job.worker_id != worker_id:
+            return None
+
+        return job
+
+
+def create_job_store(store_url: str) -> Type[BaseJobStore]:
+    """Returns a job store instance for the provided store url,
+        e.g. sqlite:///shared/jobs.db or memory://
+
+    Parameters
+    ----------
+    store_url : str
+        The job store url, whose scheme selects the job store type
+
+    Returns
+    -------
+    Type[BaseJobStore]
+        An instance of a BaseJobStore subclass
+
+    Raises
+    ------
+    NotImplementedError
+        When the provided store url scheme does not exist
+    """
+    scheme, _, location = store_url.partition("://")
+    store_type: JobStoreTypes = JobStoreTypes(scheme)
+
+    match store_type:
+        case JobStoreTypes.SQLITE:
+            # sqlite:///relative.db -> relative.db, sqlite:////abs/path.db -> /abs/path.db
+            return SqliteJobStore(database_path=location[1:] if location.startswith("/") else location)
+        case JobStoreTypes.MEMORY:
+            return InMemoryJobStore()
+        case _:
+            raise NotImplementedError(
+                f"Provided job store not implemented: {store_url}")
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+from bounce_challenge.scraper.utils.scraper_utils import \
+    find_scraper_class_by_name
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Optional, Type
+
+    from bounce_challenge.scraper.base.scraper import BaseScraper
+    from bounce_challenge.scraper.work_queue.job import ScraperJob
+    from bounce_challenge.scraper.work_queue.job_store import BaseJobStore
+
+
+class ScraperWorker():
+    """Claims scraping jobs from a shared job store and runs them until the store is drained.
+        While a job runs, a background thread heartbeats its lease so that the jobs of crashed
+        workers are re-queued. The heartbeat does not track progress, hence stalled jobs are only
+        re-queued once they exceed job_timeout_seconds, when provided.
+    """
+
+    def __init__(self: ScraperWorker, job_store: Type[BaseJobStore], auth_method: Any = None,
+                 lease_seconds: float = 60.0, poll_seconds: float = 5.0, worker_id: Optional[str] = None,
+                 job_timeout_seconds: Optional[float] = None) -> None:
+        """Instantiates a ScraperWorker
+
+        Parameters
+        ----------
+        job_store : Type[BaseJobStore]
+            The shared job store from which to claim jobs
+        auth_method : Any, optional
+            The auth method injected into every scraper, by default None
+        lease_seconds : float, optional
+            The lease duration, renewed every third of its length, by default 60.0
+        poll_seconds : float, optional
+            The amount of seconds to wait between claims when no job is available, by default 5.0
+        worker_id : Optional[str], optional
+            The worker identifier, by default generated from the host name and process id
+        job_timeout_seconds : Optional[float], optional
+            The amount of seconds after which a job's lease is no longer renewed, letting it expire
+            and the job be re-queued, by default None (renewed until the job finishes)
+        """
+        self._job_store = job_store
+        self._auth_method = auth_method
+        self._lease_seconds = lease_seconds
+        self._poll_seconds = poll_seconds
+        self._worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._job_timeout_seconds = job_timeout_seconds
+
+    def run(self: ScraperWorker, wait_for_jobs: bool = False) -> int:
+        """Claims and processes jobs until none is available
+
+        Parameters
+        ----------
+        wait_for_jobs : bool, optional
+            Keep polling the job store instead of stopping once it is drained, by default False
+
+        Returns
+        -------
+        int
+            The number of jobs successfully completed by this worker
+        """
+        completed_jobs: int = 0
+
+        while True:
+            job: Optional[ScraperJob] = self._job_store.claim(
+                worker_id=self._worker_id, lease_seconds=self._lease_seconds)
+
+            if job is None:
+                if not wait_for_jobs:
+                    break
+
+                time.sleep(self._poll_seconds)
+                continue
+
+            if self._process_job(job=job):
+                completed_jobs += 1
+
+        logging.info(f"Worker {self._worker_id} completed {completed_jobs} jobs")
+
+        return completed_jobs
+
+    def _process_job(self: ScraperWorker, job: ScraperJob) -> bool:
+        logging.info(
+            f"Worker {self._worker_id} claimed job {job.job_id} ({job.scraper_name}, {job.user_name}), attempt {job.attempts}")
+
+        stop_heartbeat: threading.Event = threading.Event()
+        heartbeat_thread: threading.Thread = threading.Thread(
+            target=self._heartbeat, args=(job, stop_heartbeat), daemon=True)
+        heartbeat_thread.start()
+
+        try:
+            scraper_instance: Type[BaseScraper] = find_scraper_class_by_name(
+                scraper_name=job.scraper_name)
+
+            scraper_args: Dict[str, Any] = {
+                "user": job.user_name,
+                "output_path": job.output_path,
+                "data_filters": job.data_filters
+            }
+
+            scraper: Type[BaseScraper] = scraper_instance(auth_method=self._auth_method)
+            scraper.start(**scraper_args)
+        except Exception as error:
+            logging.exception(f"Job {job.job_id} failed")
+            stop_heartbeat.set()
+            heartbeat_thread.join()
+            self._job_store.fail(job_id=job.job_id, worker_id=self._worker_id, error=repr(error))
+
+            return False
+
+        stop_heartbeat.set()
+        heartbeat_thread.join()
+
+        if not self._job_store.complete(job_id=job.job_id, worker_id=self._worker_id, result=job.output_path):
+            # the lease expired and the job was handed to another worker, which will record it instead
+            logging.warning(f"Lost the lease of job {job.job_id} before completing it")
+            return False
+
+        return True
+
+    def _heartbeat(self: ScraperWorker, job: ScraperJob, stop_heartbeat: threading.Event) -> None:
+        job_deadline: Optional[float] = None if self._job_timeout_seconds is None else \
+            time.monotonic() + self._job_timeout_seconds
+
+        while not stop_heartbeat.wait(timeout=self._lease_seconds / 3):
+            if job_deadline is not None and time.monotonic() > job_deadline:
+                logging.warning(
+                    f"Job {job.job_id} exceeded its {self._job_timeout_seconds}s timeout, no longer renewing its lease")
+                return
+
+            try:
+                is_lease_held: bool = self._job_store.heartbeat(
+                    job_id=job.job_id, worker_id=self._worker_id, lease_seconds=self._lease_seconds)
+            except Exception as error:
+                # e.g. a locked database, the lease is still held until it expires hence keep trying
+                logging.warning(f"Failed to heartbeat job {job.job_id}: {error!r}")
+                continue
+
+            if not is_lease_held:
+                logging.warning(f"Lost the lease of job {job.job_id}")
+                return
+
+    @property
+    def worker_id(self: ScraperWorker) -> str:
+        """Returns the worker identifier
+
+        Returns
+        -------
+        str
+            The worker identifier
+        """
+        return self._worker_id
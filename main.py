@@ -1,16 +1,38 @@
 import argparse
+import logging
 import os
+from enum import Enum, unique
 from typing import TYPE_CHECKING
 
 from bounce_challenge.scraper.base import default_vars
 from bounce_challenge.scraper.base.auth_method import AuthMethodToken
+from bounce_challenge.scraper.base.http_archive import (HttpArchiveRecorder,
+                                                        HttpArchiveReplayer,
+                                                        ReplayLatencyMode)
 from bounce_challenge.scraper.utils.scraper_utils import \
     find_scraper_class_by_name
+from bounce_challenge.scraper.work_queue.job import ScraperJob
+from bounce_challenge.scraper.work_queue.job_store import (JobStoreTypes,
+                                                          create_job_store)
+from bounce_challenge.scraper.work_queue.worker import ScraperWorker
 
 if TYPE_CHECKING:
     from typing import Any, Dict, List, Optional, Type
 
+    from requests.adapters import BaseAdapter
+
     from bounce_challenge.scraper.base.scraper import BaseScraper
+    from bounce_challenge.scraper.work_queue.job_store import BaseJobStore
+
+
+@unique
+class RunMode(Enum):
+    """
+        Represents the list of available entrypoint run modes
+    """
+    RUN = "run"
+    ENQUEUE = "enqueue"
+    WORK = "work"
 
 
 def main():
@@ -21,40 +43,107 @@ def main():
     2- Retrieve the associated Scraper class
     3- Initialize the Scraper instance and start the scraping process
 
+    Alternatively, in the enqueue mode the scraping jobs are added to a shared job store,
+    and in the work mode jobs are claimed from the job store and processed until it is drained.
+
     Raises
     ------
     ValueError
         Auth Token has been requested but the associated environment variable,
         AUTH_TOKEN could not be retrieved or was empty.
+    ValueError
+        A required argument for the requested run mode is missing or invalid.
     """
     command_parser: argparse.ArgumentParser = argparse.ArgumentParser(
         prog="main_parser",
         description="Parses the provided entrypoint arguments"
     )
 
-    command_parser.add_argument("-s", "--scraper_name", type=str, required=True,
+    command_parser.add_argument("-m", "--mode", type=str, required=False, default=RunMode.RUN.value,
+                                choices=[run_mode.value for run_mode in RunMode],
+                                help="Scrape directly, enqueue jobs into the job store or work on enqueued jobs")
+    command_parser.add_argument("-s", "--scraper_name", type=str, required=False,
                                 help="The name of the scraper instance to initialize")
-    command_parser.add_argument(
-        "-u", "--user_name", type=str, required=True, help="The username to scrape")
-    command_parser.add_argument("-o", "--output_path", type=str, required=True,
-                                help="The local filesystem path in which to store the data")
+    command_parser.add_argument("-u", "--user_name", type=str, required=False, nargs='+',
+                                help="The username(s) to scrape, multiple are only supported when enqueueing")
+    command_parser.add_argument("-o", "--output_path", type=str, required=False,
+                                help="The local filesystem path in which to store the data, "
+                                "when enqueueing {user} is replaced by each username")
     command_parser.add_argument("-t", "--use_token", required=False,
                                 action="store_true", help="Should an authentication token be used")
     command_parser.add_argument('-f', '--filters_list', type=list,
                                 required=False, nargs='+', help='The list of filters to use')
+    command_parser.add_argument("-q", "--queue_url", type=str, required=False, default="sqlite:///scraper_jobs.db",
+                                help="The shared job store url, e.g. sqlite:///shared/jobs.db")
+    command_parser.add_argument("-l", "--lease_seconds", type=float, required=False, default=60.0,
+                                help="The amount of seconds a claimed job is leased for between heartbeats")
+    command_parser.add_argument("-j", "--job_timeout", type=float, required=False,
+                                help="The amount of seconds after which a stalled job's lease is no longer renewed")
+    command_parser.add_argument("-w", "--wait_for_jobs", required=False, action="store_true",
+                                help="Keep polling the job store for new jobs once it is drained")
+    command_parser.add_argument("-r", "--record_path", type=str, required=False,
+                                help="Record every HTTP exchange into the provided archive path (run mode only)")
+    command_parser.add_argument("-p", "--replay_path", type=str, required=False,
+                                help="Serve the HTTP exchanges from the provided recorded archive (run mode only)")
+    command_parser.add_argument("--replay_latency", type=str, required=False, default=ReplayLatencyMode.NONE.value,
+                                choices=[latency_mode.value for latency_mode in ReplayLatencyMode],
+                                help="Replay the responses instantly, with the recorded or with the scaled latency")
+    command_parser.add_argument("--replay_latency_scale", type=float, required=False, default=1.0,
+                                help="The factor applied to the recorded latency when replaying with scaled latency")
 
     parsed_args: argparse.Namespace = command_parser.parse_args()
 
     # fetch the associated arguments provided on input
+    run_mode: RunMode = RunMode(parsed_args.mode)
     scraper_name: str = parsed_args.scraper_name
-    user_name: str = parsed_args.user_name
+    user_names: List[str] = parsed_args.user_name or []
     is_auth_use_token: bool = parsed_args.use_token
     output_path: str = parsed_args.output_path
     filters_list: List[str] = parsed_args.filters_list
+    data_filters: List[str] = filters_list if filters_list else default_vars.default_data_filters
 
-    # retrieve the class type for the corresponding scraper name
-    scraper_instance: Type[BaseScraper] = find_scraper_class_by_name(
-        scraper_name=scraper_name)
+    # the memory job store is process local, hence could never be shared between enqueue and work runs
+    if run_mode != RunMode.RUN and parsed_args.queue_url.startswith(f"{JobStoreTypes.MEMORY.value}://"):
+        raise ValueError(
+            f"The process local {JobStoreTypes.MEMORY.value} job store can't be used in {run_mode.value} mode")
+
+    if run_mode != RunMode.WORK:
+        if not scraper_name or not user_names or not output_path:
+            raise ValueError(
+                f"Arguments scraper_name, user_name and output_path are required in {run_mode.value} mode")
+
+    if run_mode == RunMode.ENQUEUE:
+        # jobs may be processed by workers on other machines or directories, hence the path must be absolute
+        if not os.path.isabs(output_path):
+            raise ValueError(
+                "Argument output_path must be an absolute path (e.g. on a shared volume) when enqueueing")
+
+        if len(user_names) > 1 and "{user}" not in output_path:
+            raise ValueError(
+                "Argument output_path must contain {user} when enqueueing multiple usernames")
+
+        job_store: Type[BaseJobStore] = create_job_store(
+            store_url=parsed_args.queue_url)
+
+        for user_name in user_names:
+            job_store.enqueue(job=ScraperJob(
+                scraper_name=scraper_name,
+                user_name=user_name,
+                output_path=output_path.replace("{user}", user_name),
+                data_filters=data_filters
+            ))
+
+        logging.info(f"Enqueued {len(user_names)} jobs into {parsed_args.queue_url}")
+        return
+
+    if run_mode == RunMode.RUN and len(user_names) > 1:
+        raise ValueError("Multiple usernames are only supported in enqueue mode")
+
+    if run_mode != RunMode.RUN and (parsed_args.record_path or parsed_args.replay_path):
+        raise ValueError("Recording and replaying are only supported in run mode")
+
+    if parsed_args.record_path and parsed_args.replay_path:
+        raise ValueError("Arguments record_path and replay_path are mutually exclusive")
 
     # hold an instance of an auth method should one be requested
     auth_method: Optional[AuthMethodToken] = None
@@ -69,17 +158,49 @@ def main():
 
         auth_method: AuthMethodToken = AuthMethodToken(token=auth_token)
 
+    if run_mode == RunMode.WORK:
+        worker: ScraperWorker = ScraperWorker(
+            job_store=create_job_store(store_url=parsed_args.queue_url),
+            auth_method=auth_method,
+            lease_seconds=parsed_args.lease_seconds,
+            job_timeout_seconds=parsed_args.job_timeout
+        )
+        worker.run(wait_for_jobs=parsed_args.wait_for_jobs)
+        return
+
+    # retrieve the class type for the corresponding scraper name
+    scraper_instance: Type[BaseScraper] = find_scraper_class_by_name(
+        scraper_name=scraper_name)
+
     # create a dictionary of arguments to be unpacked and injected into the modular scraper
     scraper_args: Dict[str, Any] = {
-        "user": user_name,
+        "user": user_names[0],
         "output_path": output_path,
-        "data_filters": filters_list if filters_list else default_vars.default_data_filters
+        "data_filters": data_filters
     }
 
+    # hold a transport adapter should the HTTP traffic be recorded or replayed
+    session_adapter: Optional[BaseAdapter] = None
+
+    if parsed_args.record_path:
+        session_adapter = HttpArchiveRecorder(archive_path=parsed_args.record_path)
+    elif parsed_args.replay_path:
+        session_adapter = HttpArchiveReplayer(
+            archive_path=parsed_args.replay_path,
+            latency_mode=ReplayLatencyMode(parsed_args.replay_latency),
+            latency_scale=parsed_args.replay_latency_scale
+        )
+
     # create an instance of the target scraper class
-    scraper: Type[BaseScraper] = scraper_instance(auth_method=auth_method)
-    # initialize the scraping process
-    scraper.start(**scraper_args)
+    scraper: Type[BaseScraper] = scraper_instance(
+        auth_method=auth_method, session_adapter=session_adapter)
+    try:
+        # initialize the scraping process
+        scraper.start(**scraper_args)
+    finally:
+        # keep the recording of aborted runs as well, e.g. to replay throttled or failing traffic
+        if isinstance(session_adapter, HttpArchiveRecorder):
+            session_adapter.save()
 
 
 if __name__ == "__main__":
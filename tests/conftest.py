@@ -0,0 +1,27 @@
+import json
+import zipfile
+
+import pytest
+
+
+@pytest.fixture
+def write_http_archive(tmp_path):
+    """Returns a function writing the provided exchanges into an archive
+        readable by HttpArchiveReplayer, as recorded by HttpArchiveRecorder
+    """
+    def writer(exchanges):
+        archive_path = tmp_path / "traffic.zip"
+
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            index = []
+
+            for (exchange_id, (url, status_code, headers, body)) in enumerate(exchanges):
+                index.append({"method": "GET", "url": url, "status_code": status_code,
+                              "reason": "", "headers": headers, "elapsed": 0.0})
+                archive.writestr(f"bodies/{exchange_id}", json.dumps(body) if body is not None else b"")
+
+            archive.writestr("index.json", json.dumps(index))
+
+        return str(archive_path)
+
+    return writer
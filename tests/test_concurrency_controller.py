@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from bounce_challenge.scraper.base.concurrency_controller import \
+    AdaptiveConcurrencyController
+
+
+def _record(controller, status_code=200, latency=0.2):
+    with controller.slot() as backoff_epoch:
+        pass
+
+    controller.record(status_code=status_code, latency=latency, backoff_epoch=backoff_epoch)
+
+
+def test_limit_increases_additively_after_each_healthy_window():
+    controller = AdaptiveConcurrencyController(initial_limit=2, max_limit=4)
+
+    _record(controller)
+    assert controller.limit == 2
+    _record(controller)
+    assert controller.limit == 3
+
+    for _ in range(3):
+        _record(controller)
+    assert controller.limit == 4
+
+    # the limit never exceeds max_limit
+    for _ in range(10):
+        _record(controller)
+    assert controller.limit == 4
+
+
+@pytest.mark.parametrize("status_code", [403, 429, 500, 503])
+def test_limit_decreases_multiplicatively_on_throttling(status_code):
+    controller = AdaptiveConcurrencyController(initial_limit=8, max_limit=16)
+
+    _record(controller, status_code=status_code)
+    assert controller.limit == 4
+    _record(controller, status_code=status_code)
+    assert controller.limit == 2
+    _record(controller, status_code=status_code)
+    assert controller.limit == 1
+    # the limit never drops below min_limit
+    _record(controller, status_code=status_code)
+    assert controller.limit == 1
+
+
+def test_client_errors_are_not_throttling():
+    controller = AdaptiveConcurrencyController(initial_limit=4)
+
+    _record(controller, status_code=404)
+
+    assert controller.limit == 4
+
+
+def test_latency_spike_decreases_limit():
+    controller = AdaptiveConcurrencyController(initial_limit=8, max_limit=16, latency_tolerance=2.0)
+
+    _record(controller, latency=0.2)
+    _record(controller, latency=1.0)
+
+    assert controller.limit == 4
+
+
+def test_fast_responses_jitter_is_no_latency_spike():
+    controller = AdaptiveConcurrencyController(initial_limit=8, max_limit=16, min_latency_spike=0.1)
+
+    _record(controller, latency=0.001)
+    _record(controller, latency=0.05)
+
+    assert controller.limit == 8
+
+
+def test_requests_started_before_a_backoff_do_not_decrease_again():
+    controller = AdaptiveConcurrencyController(initial_limit=8, max_limit=16)
+
+    with controller.slot() as first_epoch, controller.slot() as second_epoch:
+        pass
+
+    controller.record(status_code=429, latency=0.2, backoff_epoch=first_epoch)
+    controller.record(status_code=429, latency=0.2, backoff_epoch=second_epoch)
+
+    assert controller.limit == 4
+
+
+def test_slot_blocks_beyond_the_limit():
+    controller = AdaptiveConcurrencyController(initial_limit=2, max_limit=2)
+    in_flight = []
+    max_in_flight = []
+    lock = threading.Lock()
+
+    def request():
+        with controller.slot():
+            with lock:
+                in_flight.append(1)
+                max_in_flight.append(len(in_flight))
+
+            time.sleep(0.01)
+
+            with lock:
+                in_flight.pop()
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(max_in_flight) == 2
+
+
+def test_invalid_limits_are_rejected():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyController(initial_limit=32, max_limit=16)
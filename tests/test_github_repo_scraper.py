@@ -0,0 +1,174 @@
+import csv
+import time
+
+import pytest
+from requests import Response
+from requests.exceptions import ConnectTimeout
+from requests.structures import CaseInsensitiveDict
+
+from bounce_challenge.scraper.base.http_archive import HttpArchiveReplayer
+from bounce_challenge.scraper.base.response_cache import ResponseCache
+from bounce_challenge.scraper.github.github_repo_scraper import \
+    GithubRepoScraper
+
+_FIRST_PAGE_URL = "https://api.github.com/search/repositories?q=user:bounceapp"
+_PAGE_URL = "https://api.github.com/search/repositories?q=user%3Abounceapp&page={page}"
+_PAGES = 4
+
+
+def _page_body(page):
+    return {"items": [{"id": page * 10 + item, "name": f"repo_{page}_{item}", "size": 1} for item in range(3)]}
+
+
+def _page_links(page, with_last=True):
+    links = []
+
+    if page < _PAGES:
+        links.append(f'<{_PAGE_URL.format(page=page + 1)}>; rel="next"')
+
+    if with_last:
+        links.append(f'<{_PAGE_URL.format(page=_PAGES)}>; rel="last"')
+
+    return {"link": ", ".join(links)} if links else {}
+
+
+def _page_exchanges(failing_pages=None, with_last=True):
+    failing_pages = failing_pages or {}
+    exchanges = []
+
+    for page in range(1, _PAGES + 1):
+        url = _FIRST_PAGE_URL if page == 1 else _PAGE_URL.format(page=page)
+
+        if page in failing_pages:
+            exchanges.append((url, failing_pages[page], {"retry-after": "0"}, None))
+
+        exchanges.append((url, 200, _page_links(page=page, with_last=with_last), _page_body(page=page)))
+
+    return exchanges
+
+
+class _FlakyReplayer(HttpArchiveReplayer):
+    """Raises a timeout on the first request of every failing url
+    """
+
+    def __init__(self, archive_path, failing_urls):
+        super().__init__(archive_path=archive_path)
+        self._failing_urls = set(failing_urls)
+
+    def send(self, request, **kwargs):
+        if request.url in self._failing_urls:
+            self._failing_urls.discard(request.url)
+            raise ConnectTimeout(f"Timed out connecting to {request.url}", request=request)
+
+        return super().send(request, **kwargs)
+
+
+def _scrape(archive_path, output_path, session_adapter=None):
+    scraper = GithubRepoScraper(response_cache=ResponseCache(),
+                                session_adapter=session_adapter or HttpArchiveReplayer(archive_path=archive_path))
+
+    return scraper.start(user="bounceapp", output_path=str(output_path), data_filters=["id", "name"])
+
+
+def _read_ids(output_path):
+    with open(output_path, encoding="UTF-8") as output_csv:
+        rows = list(csv.DictReader(output_csv))
+
+    assert all(row.keys() == {"id", "name"} for row in rows)
+
+    return [int(row["id"]) for row in rows]
+
+
+_EXPECTED_IDS = [page * 10 + item for page in range(1, _PAGES + 1) for item in range(3)]
+
+
+def test_scrapes_every_page_in_order(write_http_archive, tmp_path):
+    output_path = tmp_path / "data.csv"
+
+    assert _scrape(archive_path=write_http_archive(_page_exchanges()), output_path=output_path)
+    assert _read_ids(output_path) == _EXPECTED_IDS
+
+
+def test_follows_cursor_pagination(write_http_archive, tmp_path):
+    output_path = tmp_path / "data.csv"
+
+    _scrape(archive_path=write_http_archive(_page_exchanges(with_last=False)), output_path=output_path)
+
+    assert _read_ids(output_path) == _EXPECTED_IDS
+
+
+def test_retries_throttled_pages(write_http_archive, tmp_path):
+    output_path = tmp_path / "data.csv"
+
+    _scrape(archive_path=write_http_archive(_page_exchanges(failing_pages={2: 429, 3: 503})),
+            output_path=output_path)
+
+    assert _read_ids(output_path) == _EXPECTED_IDS
+
+
+def test_retries_transport_errors(write_http_archive, tmp_path, monkeypatch):
+    output_path = tmp_path / "data.csv"
+    archive_path = write_http_archive(_page_exchanges())
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+    _scrape(archive_path=archive_path, output_path=output_path,
+            session_adapter=_FlakyReplayer(archive_path=archive_path, failing_urls=[_PAGE_URL.format(page=2)]))
+
+    assert _read_ids(output_path) == _EXPECTED_IDS
+
+
+def test_retries_exhausted_rate_limit(write_http_archive, tmp_path):
+    output_path = tmp_path / "data.csv"
+    exchanges = _page_exchanges()
+    # the reset time has already passed, so the retry is immediate
+    exchanges.insert(1, (_PAGE_URL.format(page=2), 403,
+                         {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "0"}, None))
+
+    _scrape(archive_path=write_http_archive(exchanges), output_path=output_path)
+
+    assert _read_ids(output_path) == _EXPECTED_IDS
+
+
+def _response(status_code, headers):
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+
+    return response
+
+
+@pytest.mark.parametrize(("status_code", "headers", "is_retryable"), [
+    (403, {}, False),
+    (403, {"x-ratelimit-remaining": "1"}, False),
+    (403, {"x-ratelimit-remaining": "0"}, True),
+    (403, {"retry-after": "5"}, True),
+    (429, {}, True),
+    (502, {}, True),
+    (404, {}, False),
+])
+def test_is_retryable(status_code, headers, is_retryable):
+    assert GithubRepoScraper()._is_retryable(response=_response(status_code, headers)) == is_retryable
+
+
+def test_retry_delay():
+    scraper = GithubRepoScraper()
+    reset = str(int(time.time()) + 30)
+
+    assert scraper._get_retry_delay(response=_response(429, {"retry-after": "5"}), attempt=0) == 5.0
+    assert 28 <= scraper._get_retry_delay(
+        response=_response(403, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset}), attempt=0) <= 30
+    assert scraper._get_retry_delay(response=_response(403, {"x-ratelimit-remaining": "0"}), attempt=0) == 60.0
+    assert scraper._get_retry_delay(response=_response(429, {}), attempt=0) == 60.0
+    assert scraper._get_retry_delay(response=_response(503, {}), attempt=2) == 4.0
+
+
+@pytest.mark.parametrize("status_code", [404, 501])
+def test_failed_page_leaves_no_output(write_http_archive, tmp_path, status_code):
+    output_path = tmp_path / "data.csv"
+    exchanges = [exchange for exchange in _page_exchanges() if exchange[0] != _PAGE_URL.format(page=3)]
+    exchanges.append((_PAGE_URL.format(page=3), status_code, {"retry-after": "0"}, None))
+
+    with pytest.raises(ValueError, match="Aborting due to error received"):
+        _scrape(archive_path=write_http_archive(exchanges), output_path=output_path)
+
+    assert list(tmp_path.glob("*data.csv*")) == []
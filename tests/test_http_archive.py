@@ -0,0 +1,91 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests import Session
+
+from bounce_challenge.scraper.base.http_archive import (HttpArchiveRecorder,
+                                                        HttpArchiveReplayer,
+                                                        ReplayLatencyMode)
+
+# the delay between the response headers and its body, which must be part of the recorded latency
+_BODY_DELAY = 0.1
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+
+        self.send_response(200 if self.path != "/missing" else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Link", f'<http://localhost{self.path}?page=2>; rel="next"')
+        self.send_header("X-RateLimit-Remaining", "59")
+        self.end_headers()
+        self.wfile.flush()
+
+        time.sleep(_BODY_DELAY)
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def _session(adapter):
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def test_recorded_exchanges_are_replayed(server_url, tmp_path):
+    archive_path = str(tmp_path / "traffic.zip")
+    urls = [f"{server_url}/repos", f"{server_url}/missing"]
+
+    recorder = HttpArchiveRecorder(archive_path=archive_path)
+    with _session(recorder) as session:
+        recorded_responses = [session.get(url) for url in urls]
+
+    replayer = HttpArchiveReplayer(archive_path=archive_path, latency_mode=ReplayLatencyMode.RECORDED)
+    with _session(replayer) as session:
+        for (url, recorded_response) in zip(urls, recorded_responses):
+            replay_start = time.perf_counter()
+            replayed_response = session.get(url)
+
+            assert time.perf_counter() - replay_start >= _BODY_DELAY
+            assert replayed_response.status_code == recorded_response.status_code
+            assert replayed_response.json() == recorded_response.json()
+            assert replayed_response.links == recorded_response.links
+            assert replayed_response.headers["x-ratelimit-remaining"] == "59"
+            assert "content-length" not in replayed_response.headers
+
+
+def test_unchanged_recording_is_saved_once(server_url, tmp_path):
+    archive_path = tmp_path / "traffic.zip"
+    recorder = HttpArchiveRecorder(archive_path=str(archive_path))
+    session = _session(recorder)
+
+    session.get(f"{server_url}/repos")
+    recorder.save()
+    os.remove(archive_path)
+
+    # closing the session closes the adapter once per mounted prefix
+    session.close()
+
+    assert not archive_path.exists()
@@ -0,0 +1,185 @@
+import threading
+import time
+
+import pytest
+
+from bounce_challenge.scraper.work_queue.job import JobStatus, ScraperJob
+from bounce_challenge.scraper.work_queue.job_store import (InMemoryJobStore,
+                                                          SqliteJobStore,
+                                                          create_job_store)
+from bounce_challenge.scraper.work_queue.worker import ScraperWorker
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def job_store_factory(request, tmp_path):
+    def factory(max_attempts=3):
+        if request.param == "sqlite":
+            return SqliteJobStore(database_path=str(tmp_path / "jobs.db"), max_attempts=max_attempts)
+
+        return InMemoryJobStore(max_attempts=max_attempts)
+
+    return factory
+
+
+def _enqueue_job(job_store, user_name="bounceapp"):
+    return job_store.enqueue(job=ScraperJob(
+        scraper_name="github_repositories", user_name=user_name,
+        output_path=f"{user_name}.csv", data_filters=["id"]))
+
+
+def test_claim_leases_job_to_a_single_worker(job_store_factory):
+    job_store = job_store_factory()
+    job_id = _enqueue_job(job_store)
+
+    job = job_store.claim(worker_id="worker_1", lease_seconds=60)
+
+    assert job.job_id == job_id
+    assert job.status == JobStatus.RUNNING
+    assert job.worker_id == "worker_1"
+    assert job.attempts == 1
+    assert job.data_filters == ["id"]
+    assert job_store.claim(worker_id="worker_2", lease_seconds=60) is None
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(job_store_factory):
+    job_store = job_store_factory()
+    job_id = _enqueue_job(job_store)
+
+    job_store.claim(worker_id="worker_1", lease_seconds=0.01)
+    time.sleep(0.05)
+    job = job_store.claim(worker_id="worker_2", lease_seconds=60)
+
+    assert job.job_id == job_id
+    assert job.attempts == 2
+    # the original worker lost its lease and can no longer record the job
+    assert not job_store.heartbeat(job_id=job_id, worker_id="worker_1", lease_seconds=60)
+    assert not job_store.complete(job_id=job_id, worker_id="worker_1", result="stale")
+    assert job_store.complete(job_id=job_id, worker_id="worker_2", result="bounceapp.csv")
+    assert job_store.get_jobs(status=JobStatus.DONE)[0].result == "bounceapp.csv"
+
+
+def test_heartbeat_keeps_the_lease(job_store_factory):
+    job_store = job_store_factory()
+    job_id = _enqueue_job(job_store)
+
+    job_store.claim(worker_id="worker_1", lease_seconds=0.05)
+
+    for _ in range(3):
+        time.sleep(0.02)
+        assert job_store.heartbeat(job_id=job_id, worker_id="worker_1", lease_seconds=0.05)
+
+    assert job_store.claim(worker_id="worker_2", lease_seconds=60) is None
+
+
+def test_failed_job_is_requeued_until_max_attempts(job_store_factory):
+    job_store = job_store_factory(max_attempts=2)
+    job_id = _enqueue_job(job_store)
+
+    job_store.claim(worker_id="worker_1", lease_seconds=60)
+    assert job_store.fail(job_id=job_id, worker_id="worker_1", error="boom")
+    assert job_store.get_jobs()[0].status == JobStatus.PENDING
+
+    job_store.claim(worker_id="worker_1", lease_seconds=60)
+    assert job_store.fail(job_id=job_id, worker_id="worker_1", error="boom")
+
+    (job,) = job_store.get_jobs()
+    assert job.status == JobStatus.FAILED
+    assert job.error == "boom"
+    assert job_store.claim(worker_id="worker_1", lease_seconds=60) is None
+
+
+def test_expired_leases_count_towards_max_attempts(job_store_factory):
+    job_store = job_store_factory(max_attempts=2)
+    _enqueue_job(job_store)
+    claims = 0
+
+    # workers which never heartbeat, e.g. crashing on the job
+    while job_store.claim(worker_id=f"worker_{claims}", lease_seconds=0.01) is not None:
+        claims += 1
+        time.sleep(0.03)
+
+    (job,) = job_store.get_jobs()
+    assert claims == 2
+    assert job.status == JobStatus.FAILED
+    assert job.error == "lease expired"
+
+
+def test_jobs_are_claimed_in_enqueue_order(job_store_factory):
+    job_store = job_store_factory()
+
+    for user_name in ("first", "second", "third"):
+        _enqueue_job(job_store, user_name=user_name)
+
+    claimed = [job_store.claim(worker_id="worker_1", lease_seconds=60).user_name for _ in range(3)]
+
+    assert claimed == ["first", "second", "third"]
+
+
+def test_create_job_store_by_url(tmp_path):
+    assert isinstance(create_job_store(store_url=f"sqlite:///{tmp_path / 'jobs.db'}"), SqliteJobStore)
+    assert isinstance(create_job_store(store_url="memory://"), InMemoryJobStore)
+
+    with pytest.raises(ValueError):
+        create_job_store(store_url="redis://localhost")
+
+
+def test_worker_records_failures_until_the_job_fails():
+    job_store = InMemoryJobStore(max_attempts=2)
+    job_store.enqueue(job=ScraperJob(scraper_name="unknown_scraper", user_name="bounceapp",
+                                     output_path="bounceapp.csv"))
+
+    completed_jobs = ScraperWorker(job_store=job_store, lease_seconds=60).run()
+
+    (job,) = job_store.get_jobs()
+    assert completed_jobs == 0
+    assert job.status == JobStatus.FAILED
+    assert job.attempts == 2
+
+
+class _FlakyHeartbeatStore(InMemoryJobStore):
+    """Raises on the first heartbeat, as a locked database would
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.heartbeats = 0
+
+    def heartbeat(self, job_id, worker_id, lease_seconds):
+        self.heartbeats += 1
+
+        if self.heartbeats == 1:
+            raise RuntimeError("database is locked")
+
+        return super().heartbeat(job_id=job_id, worker_id=worker_id, lease_seconds=lease_seconds)
+
+
+def _run_heartbeat(worker, job, seconds):
+    stop_heartbeat = threading.Event()
+    heartbeat_thread = threading.Thread(target=worker._heartbeat, args=(job, stop_heartbeat))
+    heartbeat_thread.start()
+    time.sleep(seconds)
+    stop_heartbeat.set()
+    heartbeat_thread.join()
+
+
+def test_heartbeat_survives_store_errors():
+    job_store = _FlakyHeartbeatStore()
+    _enqueue_job(job_store)
+    worker = ScraperWorker(job_store=job_store, lease_seconds=0.06, worker_id="worker_1")
+    job = job_store.claim(worker_id="worker_1", lease_seconds=0.06)
+
+    _run_heartbeat(worker=worker, job=job, seconds=0.2)
+
+    assert job_store.heartbeats > 2
+    assert job_store.claim(worker_id="worker_2", lease_seconds=60) is None
+
+
+def test_heartbeat_stops_after_the_job_timeout(job_store_factory):
+    job_store = job_store_factory()
+    _enqueue_job(job_store)
+    worker = ScraperWorker(job_store=job_store, lease_seconds=0.06, worker_id="worker_1", job_timeout_seconds=0.05)
+    job = job_store.claim(worker_id="worker_1", lease_seconds=0.06)
+
+    _run_heartbeat(worker=worker, job=job, seconds=0.2)
+
+    assert job_store.claim(worker_id="worker_2", lease_seconds=60).job_id == job.job_id
@@ -0,0 +1,105 @@
+import random
+import threading
+import time
+
+import pytest
+
+from bounce_challenge.scraper.base.pipeline import Pipeline, PipelineStage
+
+
+def _jitter(item):
+    time.sleep(random.random() / 500)
+    return item
+
+
+def test_results_keep_the_source_order_with_parallel_stages():
+    results = []
+    pipeline = Pipeline(stages=[
+        PipelineStage(name="double", function=lambda item: _jitter(item * 2), workers=4),
+        PipelineStage(name="increment", function=lambda item: _jitter(item + 1), workers=3)
+    ], queue_size=2)
+
+    pipeline.run(items=range(200), sink=results.append)
+
+    assert results == [item * 2 + 1 for item in range(200)]
+
+
+def test_items_in_flight_are_bounded():
+    produced = []
+    consumed = []
+    max_ahead = []
+    pipeline = Pipeline(stages=[PipelineStage(name="identity", function=lambda item: item)], queue_size=2)
+
+    def source():
+        for item in range(100):
+            produced.append(item)
+            yield item
+
+    def slow_sink(item):
+        time.sleep(0.001)
+        consumed.append(item)
+        max_ahead.append(len(produced) - len(consumed))
+
+    pipeline.run(items=source(), sink=slow_sink)
+
+    assert consumed == list(range(100))
+    # the window of two queues of 2 items and a single worker, plus the item produced while waiting for room
+    assert max(max_ahead) <= 2 * 2 + 1 + 1
+
+
+def test_stage_error_is_raised_after_delivering_previous_items():
+    results = []
+
+    def failing(item):
+        if item == 10:
+            raise KeyError("boom")
+        return item
+
+    pipeline = Pipeline(stages=[PipelineStage(name="failing", function=failing, workers=3)], queue_size=2)
+
+    with pytest.raises(KeyError):
+        pipeline.run(items=range(10 ** 6), sink=results.append)
+
+    assert results == list(range(10))
+    assert threading.active_count() == 1
+
+
+def test_sink_error_is_raised():
+    def failing_sink(item):
+        raise IOError("disk full")
+
+    pipeline = Pipeline(stages=[PipelineStage(name="identity", function=lambda item: item, workers=2)])
+
+    with pytest.raises(IOError):
+        pipeline.run(items=range(100), sink=failing_sink)
+
+    assert threading.active_count() == 1
+
+
+def test_source_error_is_raised_after_delivering_produced_items():
+    results = []
+
+    def failing_source():
+        yield from range(5)
+        raise ValueError("invalid page")
+
+    pipeline = Pipeline(stages=[PipelineStage(name="identity", function=lambda item: item, workers=2)])
+
+    with pytest.raises(ValueError):
+        pipeline.run(items=failing_source(), sink=results.append)
+
+    assert results == list(range(5))
+
+
+def test_empty_source():
+    results = []
+
+    Pipeline(stages=[PipelineStage(name="identity", function=lambda item: item)]).run(
+        items=[], sink=results.append)
+
+    assert results == []
+
+
+def test_pipeline_requires_stages():
+    with pytest.raises(ValueError):
+        Pipeline(stages=[])
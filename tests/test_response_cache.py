@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from bounce_challenge.scraper.base.response_cache import (DecodedResponse,
+                                                          ResponseCache)
+
+
+def test_concurrent_identical_requests_are_fetched_once():
+    response_cache = ResponseCache()
+    fetches = []
+    results = []
+    release_fetch = threading.Event()
+
+    def fetch():
+        fetches.append(1)
+        release_fetch.wait(timeout=5)
+        return {"items": [1, 2]}
+
+    def request():
+        results.append(response_cache.get_or_fetch(key="page", fetch=fetch))
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    # let every caller join the in-flight request before it completes
+    time.sleep(0.05)
+    release_fetch.set()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(fetches) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+def test_results_are_memoized_until_they_expire():
+    response_cache = ResponseCache(ttl_seconds=0.05)
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return len(fetches)
+
+    assert response_cache.get_or_fetch(key="page", fetch=fetch) == 1
+    assert response_cache.get_or_fetch(key="page", fetch=fetch) == 1
+
+    time.sleep(0.1)
+
+    assert response_cache.get_or_fetch(key="page", fetch=fetch) == 2
+
+
+def test_errors_are_shared_but_not_cached():
+    response_cache = ResponseCache()
+    calls = []
+
+    def failing_fetch():
+        calls.append(1)
+        raise ConnectionError("boom")
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            response_cache.get_or_fetch(key="page", fetch=failing_fetch)
+
+    assert len(calls) == 2
+    assert response_cache.get_or_fetch(key="page", fetch=lambda: "recovered") == "recovered"
+
+
+def test_uncacheable_results_are_not_memoized():
+    response_cache = ResponseCache()
+    is_cacheable = lambda response: response.status_code < 300  # noqa: E731
+
+    failed_response = response_cache.get_or_fetch(
+        key="page", fetch=lambda: DecodedResponse(status_code=500), is_cacheable=is_cacheable)
+    response = response_cache.get_or_fetch(
+        key="page", fetch=lambda: DecodedResponse(status_code=200), is_cacheable=is_cacheable)
+
+    assert failed_response.status_code == 500
+    assert response.status_code == 200
+
+
+def test_least_recently_used_entries_are_evicted():
+    response_cache = ResponseCache(max_entries=2)
+
+    response_cache.get_or_fetch(key="first", fetch=lambda: 1)
+    response_cache.get_or_fetch(key="second", fetch=lambda: 2)
+    # refresh the first entry, making the second one the least recently used
+    response_cache.get_or_fetch(key="first", fetch=lambda: None)
+    response_cache.get_or_fetch(key="third", fetch=lambda: 3)
+
+    assert response_cache.get_or_fetch(key="first", fetch=lambda: None) == 1
+    assert response_cache.get_or_fetch(key="second", fetch=lambda: "refetched") == "refetched"
+
+
+def test_decoded_response_decodes_its_body_once():
+    response = DecodedResponse(status_code=200, content=b'{"items": [{"id": 1}]}')
+
+    assert response.data == {"items": [{"id": 1}]}
+    assert response.data is response.data
+    assert response.content == b""
+    assert DecodedResponse(status_code=204).data is None